@@ -72,17 +72,16 @@ def corrupt(x, h, n, snr):
       assert(h[0] == fs)
       h = h[1] # copy the samples from (sampling_rate, samples) tuple
       channel_one = h[:,0]
-      max_h = max(channel_one)
-      delay_impulse = [i for i, j in enumerate(channel_one) if j == max_h][0]
-      before_impulse = np.floor(fs * 0.001)
-      after_impulse = np.floor(fs * 0.05)
+      delay_impulse = int(np.argmax(channel_one)) # first occurrence of the peak
+      before_impulse = int(np.floor(fs * 0.001))
+      after_impulse = int(np.floor(fs * 0.05))
       direct_rir = channel_one[max(0, delay_impulse - before_impulse):min(len(channel_one), delay_impulse + after_impulse)]
       direct_rir = np.array(direct_rir)
       direct_signal = signal.fftconvolve(x, direct_rir)
 
       # compute the reverberant signal
       y = np.zeros([x.shape[0] + h.shape[0] - 1, h.shape[1]])
-      for channel in xrange(h.shape[1]):
+      for channel in range(h.shape[1]):
         y[:, channel] = signal.fftconvolve(x, h[:,channel])
     else:
       y = x
@@ -93,17 +92,12 @@ def corrupt(x, h, n, snr):
       fs_n = n[0]
       n = n[1]
       sys.stderr.write('Noise signal : '+str(n.shape) + '\n')
-      n_y = np.zeros(y.shape) 
       assert(fs_n == fs) # sampling rate of noise and signal is same
       assert(n.shape[1] == y.shape[1]) # both the reverberant signal and noise signal have the same number of channels
-      # repeat the source noise data "n" to match the length of the reverberant signal
-      num_reps = int(np.floor(n_y.shape[0] / n.shape[0]))
-      dest_array_index = 0
-      for i in xrange(0, num_reps):
-        np.copyto(n_y[n.shape[0] * i : n.shape[0] * (i+1), :], n)
-        dest_array_index = n.shape[0] * (i+1)
-      # fill the remaining portion of destination with the initial samples of n
-      np.copyto(n_y[dest_array_index:, :], n[0 : n_y.shape[0] - dest_array_index, :])
+      # repeat the source noise data "n" to match the length of the reverberant signal,
+      # the remaining portion of destination is filled with the initial samples of n
+      num_reps = int(np.ceil(float(y.shape[0]) / n.shape[0]))
+      n_y = np.tile(n, (num_reps, 1))[:y.shape[0], :]
       # normalize noise data according to the prefixed SNR value
       n_ref = n_y[:, 0]
       n_power = float(np.mean(n_ref**2))
@@ -124,18 +118,19 @@ if __name__ == "__main__":
   main_parser.add_argument('input_file', type=str, help='file with list of wave files and corresponding corruption parameters')
   main_params = main_parser.parse_args() 
   temp_file = main_params.temp_file_name
-  wav_param_list = map( lambda x: x.strip(), open(main_params.input_file))
+  wav_param_list = [line.strip() for line in open(main_params.input_file)]
   
+  # the parser for the corruption parameters is built once and reused for every line
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--rir-file', type=str, help='file with the room impulse response')
+  parser.add_argument('--noise-file', type=str, help='file with additive noise')
+  parser.add_argument('--snr-db', type=float, default=20, help='desired SNR(dB) of the output')
+  parser.add_argument('--multi-channel', type=str, default='False', help='is output multi-channel')
+  parser.add_argument('input_file', type=str, help='input-file')
+  parser.add_argument('output_file', type=str, help='output-file')
+
   for line in wav_param_list:
     try:
-      parser = argparse.ArgumentParser()
-      parser.add_argument('--rir-file', type=str, help='file with the room impulse response')
-      parser.add_argument('--noise-file', type=str, help='file with additive noise')
-      parser.add_argument('--snr-db', type=float, default=20, help='desired SNR(dB) of the output')
-      parser.add_argument('--multi-channel', type=str, default='False', help='is output multi-channel')
-      parser.add_argument('input_file', type=str, help='input-file')
-      parser.add_argument('output_file', type=str, help='output-file')
-
       parts = line.split('|') 
       wav_command = "|".join(parts[:-1])
       params = parser.parse_args(parts[-1].split())
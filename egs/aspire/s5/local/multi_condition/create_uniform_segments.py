@@ -4,21 +4,20 @@
 # creates a segments file in the provided data directory 
 # into uniform segments with specified window and overlap
 
-import imp, sys, argparse, os, math, subprocess
+import sys, argparse, os, math, subprocess, multiprocessing
 
-corruptor = imp.load_source('', 'local/multi_condition/corrupt.py')
 min_segment_length = 10 # in seconds
 def segment(total_length, window_length, overlap = 0):
   increment = window_length - overlap
   num_windows = int(math.ceil(float(total_length)/increment))
-  segments = map(lambda x: (x * increment, min( total_length, (x * increment) + window_length)), range(0, num_windows))
+  segments = [(x * increment, min(total_length, (x * increment) + window_length)) for x in range(0, num_windows)]
   if segments[-1][1] - segments[-1][0] < min_segment_length:
     segments[-2] = (segments[-2][0], segments[-1][1])
     segments.pop()
   return segments
   
 def get_wave_segments(wav_command, window_length, overlap):
-  raw_output = subprocess.check_output(wav_command+" sox -t wav - -n stat 2>&1 | grep Length ", shell = True)
+  raw_output = subprocess.check_output(wav_command+" sox -t wav - -n stat 2>&1 | grep Length ", shell = True).decode()
   parts = raw_output.split(":")
   if parts[0].strip() != "Length (seconds)":
     raise Exception("Failed while processing file ", wav_command)
@@ -26,7 +25,15 @@ def get_wave_segments(wav_command, window_length, overlap):
   segments = segment(total_length, window_length, overlap)
   return segments
 
-def prepare_segments_file(kaldi_data_dir, window_length, overlap):
+def get_wave_segments_in_worker(args):
+  # exceptions like subprocess.CalledProcessError cannot be unpickled by the
+  # parent process in python 2 (it hangs), so errors are returned as messages
+  try:
+    return (True, get_wave_segments(*args))
+  except Exception as e:
+    return (False, "{0}: {1}".format(type(e).__name__, e))
+
+def prepare_segments_file(kaldi_data_dir, window_length, overlap, num_jobs = 1):
   if not os.path.exists(kaldi_data_dir+'/wav.scp'):
     raise Exception("Not a proper kaldi data directory")
   ids = []
@@ -35,15 +42,33 @@ def prepare_segments_file(kaldi_data_dir, window_length, overlap):
     parts = line.split()
     ids.append(parts[0])
     files.append(" ".join(parts[1:]))
+  # finding the length of a recording requires decoding it with sox,
+  # so the recordings are distributed over a pool of processes
+  segment_args = [(file, window_length, overlap) for file in files]
+  if num_jobs > 1:
+    pool = multiprocessing.Pool(num_jobs)
+    try:
+      results = pool.map(get_wave_segments_in_worker, segment_args)
+    finally:
+      # also cleans up the workers if map is interrupted
+      pool.terminate()
+      pool.join()
+  else:
+    results = [get_wave_segments_in_worker(args) for args in segment_args]
+  # in both modes a failure is raised as an Exception with the original error message
+  for success, result in results:
+    if not success:
+      raise Exception(result)
+  segments_list = [result for success, result in results]
   segments_total = []
   segments_per_recording = []
   for i in range(0, len(ids)):
-    segments = get_wave_segments(files[i], window_length, overlap)
+    segments = segments_list[i]
     segments_current_recording = []
     for segment in segments:
-      segment_string = "{0}-{1:06}-{2:06} {0} {3} {4}".format(ids[i], int(segment[0] * 1000), int(segment[1]* 1000), segment[0], segment[1])
-      segments_total.append(segment_string)
-      segments_current_recording.append(segment_string.split()[0])
+      utt_id = "{0}-{1:06}-{2:06}".format(ids[i], int(segment[0] * 1000), int(segment[1]* 1000))
+      segments_total.append("{0} {1} {2} {3}".format(utt_id, ids[i], segment[0], segment[1]))
+      segments_current_recording.append(utt_id)
     segments_per_recording.append([ids[i], segments_current_recording])
   return segments_total, segments_per_recording
 if __name__ == "__main__":
@@ -54,18 +79,19 @@ if __name__ == "__main__":
   parser = argparse.ArgumentParser()
   parser.add_argument('--window-length', type = float, default = 30.0, help = 'length of the window used to cut the segment')
   parser.add_argument('--overlap', type = float, default = 5.0, help = 'overlap of neighboring windows')
+  parser.add_argument('--num-jobs', type = int, default = 1, help = 'number of processes used to find the lengths of the recordings')
   parser.add_argument('data_dir', type=str, help='directory such as data/train')
 
   params = parser.parse_args()
 
   # write the segments file
   segments_file = open(params.data_dir+"/segments", "w")
-  segments, segments_per_recording = prepare_segments_file(params.data_dir, params.window_length, params.overlap)
+  segments, segments_per_recording = prepare_segments_file(params.data_dir, params.window_length, params.overlap, params.num_jobs)
   segments_file.write("\n".join(segments))
   segments_file.close()
 
-  utt2spk_file = open(params.data_dir + "/utt2spk", "w")
-  spk2utt_file = open(params.data_dir + "/spk2utt", "w")
+  utt2spk_file = open(params.data_dir + "/utt2spk", "w", buffering = 1 << 20)
+  spk2utt_file = open(params.data_dir + "/spk2utt", "w", buffering = 1 << 20)
   # write the utt2spk file
   # assumes the recording id is the speaker ir
   for i in range(len(segments_per_recording)):
@@ -13,8 +13,7 @@ mockup_types = [1, 2]
 room_string = ['booth' ,  'office' ,  'meeting' ,  'lecture' ,  'stairway' ,  'stairway1' ,  'stairway2' ,  'corridor' ,  'bathroom' ,  'lecture1' ,  'aula_carolina', 'kitchen']
 azimuths = set(range(0, 181, 15))
 azimuths.union(range(0, 181, 45))
-azimuths = list(azimuths)
-azimuths.sort()
+azimuths = sorted(azimuths)
 file_patterns = []
 for rir_type in rir_string:
   for room in room_string:
@@ -43,6 +42,5 @@ for rir_type in rir_string:
                 output_file_name = re.sub('mat$', 'wav', re.sub('\_\*', '', file_pattern))
                 output_file_name = os.path.split(output_file_name)[1]
                 file_patterns.append(file_pattern+" "+output_file_name)
-file_patterns = list(set(file_patterns))
-file_patterns.sort()
-print "\n".join(file_patterns)
+file_patterns = sorted(set(file_patterns))
+print("\n".join(file_patterns))
@@ -36,10 +36,9 @@ def get_normalization_coefficient(file_list, is_rir, additional_scaling):
         # to 0.05 seconds after impulse. This is done as we do not want the 
         # recording length to influence the scaling factor
         channel_one = data[:, 0]
-        max_d = max(channel_one)
-        delay_impulse = [i for i, j in enumerate(channel_one) if j == max_d][0]
-        before_impulse = np.floor(rate * 0.001)
-        after_impulse = np.floor(rate * 0.05)
+        delay_impulse = int(np.argmax(channel_one)) # first occurrence of the peak
+        before_impulse = int(np.floor(rate * 0.001))
+        after_impulse = int(np.floor(rate * 0.05))
         start_index = max(0, delay_impulse - before_impulse)
         end_index = min(len(channel_one), delay_impulse + after_impulse)
       else:
@@ -56,7 +55,7 @@ def get_normalization_coefficient(file_list, is_rir, additional_scaling):
       warnings.warn("Did not find the file {0}.".format(file))
   assert(total_samples > 0)
   scaling_coefficient = np.sqrt(total_samples / total_energy)
-  print "Scaling coefficient is {0}.".format(scaling_coefficient)
+  print("Scaling coefficient is {0}.".format(scaling_coefficient))
   if math.isnan(scaling_coefficient):
     raise Exception(" Nan encountered while computing scaling coefficient. This is mostly due to numerical overflow")
   return scaling_coefficient
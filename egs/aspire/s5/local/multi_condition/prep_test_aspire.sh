@@ -23,6 +23,7 @@ max_count=100 # parameter for extract_ivectors.sh
 sub_speaker_frames=1500
 overlap=5
 window=30
+segmentation_num_jobs=10 # number of local processes used to find the recording lengths
 affix=
 ivector_scale=1.0
 pad_frames=0  # this did not seem to be helpful but leaving it as an option.
@@ -92,7 +93,7 @@ if [ $stage -le 2 ]; then
   rm -rf data/$segmented_data_dir
   copy_data_dir.sh --validate-opts "--no-text" data/$data_dir data/$segmented_data_dir || exit 1;
   cp data/$data_dir/reco2file_and_channel data/$segmented_data_dir/ || exit 1;
-  python local/multi_condition/create_uniform_segments.py --overlap $overlap --window $window data/$segmented_data_dir  || exit 1;
+  python local/multi_condition/create_uniform_segments.py --num-jobs $segmentation_num_jobs --overlap $overlap --window $window data/$segmented_data_dir  || exit 1;
   for file in cmvn.scp feats.scp; do
     rm -f data/$segmented_data_dir/$file
   done
@@ -35,7 +35,8 @@ if __name__ == "__main__":
   params = parser.parse_args()
 
   if params.output_filename == "-":
-    output = sys.stdout
+    # wav data is binary, python 3 needs the underlying byte stream of stdout
+    output = getattr(sys.stdout, 'buffer', sys.stdout)
   else:
     output = open(params.output_filename, 'wb')
 
@@ -53,5 +54,5 @@ if __name__ == "__main__":
     data = data.transpose()
     assert(data.shape[1] == 2)
     if params.output_sampling_rate != sr:
-      data = signal.resample(data,  params.output_sampling_rate * float(data.shape[0]) / sr, axis = 0)
+      data = signal.resample(data,  int(params.output_sampling_rate * float(data.shape[0]) / sr), axis = 0)
   wav_write(output, params.output_sampling_rate, data)
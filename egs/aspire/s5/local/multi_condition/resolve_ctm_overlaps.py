@@ -7,7 +7,7 @@ import sys, math, numpy as np, argparse
 break_threshold = 0.01
 def get_breaks(ctm, prev_end):
   breaks = []
-  for i in xrange(0, len(ctm)):
+  for i in range(0, len(ctm)):
     if ctm[i][2] - prev_end > break_threshold:
       breaks.append([i, ctm[i][2]])
     prev_end = ctm[i][2] + ctm[i][3]
@@ -22,14 +22,14 @@ def resolve_overlaps(ctms, window_length, overlap):
     next_ctm = ctms[ctm_index + 1]
     # find the breaks after overlap starts
     index = len(cur_ctm)
-    for i in xrange(len(cur_ctm)):
+    for i in range(len(cur_ctm)):
       if cur_ctm[i][2] + cur_ctm[i][3]/2.0 > (window_length - overlap/2.0):
         index = i
         break
     total_ctm += cur_ctm[:index]
     
     index = 0
-    for i in xrange(len(next_ctm)):
+    for i in range(len(next_ctm)):
       if next_ctm[i][2] + next_ctm[i][3]/2.0 > (overlap/2.0):
         index = i
         break
@@ -91,8 +91,7 @@ if __name__ == "__main__":
     utt2spk[parts[0]] = parts[1]
 
   ctms = read_ctm(params.ctm_in.readlines(), utt2spk)
-  speakers = ctms.keys()
-  speakers.sort()
+  speakers = sorted(ctms)
   for key in speakers:
     ctm = ctms[key]
     ctm = resolve_overlaps(ctm, params.window_length, params.overlap)
@@ -9,7 +9,7 @@
 . ./cmd.sh;
 set -e
 
-random_seed=0
+random_seed=0 # the same seed gives different corruptions under python 2 and python 3
 snrs="20:10:15:5:0"
 log_dir=exp/make_reverb
 
@@ -36,17 +36,15 @@ spk_prefix="rev${random_seed}_"
 # create the distorted wave files
 utils/copy_data_dir.sh --spk-prefix "$spk_prefix" --utt-prefix "$utt_prefix" \
   $src_dir $dest_dir
-cat $src_dir/utt2spk | awk -v p=$utt_prefix '{printf("%s%s %s\n", p, $1, $1);}' > $dest_dir/utt2uniq
+awk -v p=$utt_prefix '{printf("%s%s %s\n", p, $1, $1);}' $src_dir/utt2spk > $dest_dir/utt2uniq
 
 # create the wav.scp files
-cat $src_dir/wav.scp | sed -e "s/^\s*//g" | \
-  cut -d' ' -f1 | \
-  awk -v p2=$wav_prefix \
-  '{printf("%s%s\n", p2, $1);}'> $log_dir/corrupted_${random_seed}.list
+awk -v p2=$wav_prefix '{printf("%s%s\n", p2, $1);}' \
+  $src_dir/wav.scp > $log_dir/corrupted_${random_seed}.list
   
 # modify segments file to point to the new wav files
-cat $dest_dir/segments | awk -v p=$wav_prefix \
-  '{printf("%s %s%s %s %s\n", $1, p, $2, $3, $4);}' > $log_dir/segments_temp
+awk -v p=$wav_prefix '{printf("%s %s%s %s %s\n", $1, p, $2, $3, $4);}' \
+  $dest_dir/segments > $log_dir/segments_temp
 mv $log_dir/segments_temp $dest_dir/segments
 
 # remove these files as we would have to extract
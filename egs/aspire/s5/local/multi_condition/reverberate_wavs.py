@@ -2,27 +2,20 @@
 # Copyright 2014  Johns Hopkins University (Authors: Vijayaditya Peddinti).  Apache 2.0.
 #           2015  Tom Ko
 # script to generate multicondition training data / dev data / test data
-import argparse, glob, math, os, random, scipy.io.wavfile, sys
+import argparse, glob, itertools, os, random
 
-class list_cyclic_iterator:
-  def __init__(self, list, random_seed = 0):
-    self.list_index = 0
-    self.list = list
-    random.seed(random_seed)
-    random.shuffle(self.list)
+# note: python 3 shuffles differently from python 2 for the same seed, so the
+# impulses, noises and snrs assigned to each recording depend on the interpreter
+def list_cyclic_iterator(list, random_seed = 0):
+  random.seed(random_seed)
+  random.shuffle(list)
+  return itertools.cycle(list)
 
-  def next(self):
-    item = self.list[self.list_index]
-    self.list_index = (self.list_index + 1) % len(self.list)
-    return item
-
-def return_nonempty_lines(lines):
-  new_lines = []
-  for line in lines:
-    if len(line.strip()) > 0:
-      new_lines.append(line.strip())
-
-  return new_lines
+def read_nonempty_lines(file_name):
+  # reads the whole file in one call and strips it, dropping empty lines
+  with open(file_name, 'r') as file_handle:
+    lines = [line.strip() for line in file_handle.read().splitlines()]
+  return [line for line in lines if len(line) > 0]
 
 if __name__ == "__main__":
   parser = argparse.ArgumentParser()
@@ -45,16 +38,17 @@ if __name__ == "__main__":
   else:
     params.check_output_exists = False
 
-  wav_files = return_nonempty_lines(open(params.wav_file_list, 'r').readlines())
-  wav_out_files = return_nonempty_lines(open(params.output_wav_file_list, 'r').readlines())
+  wav_files = read_nonempty_lines(params.wav_file_list)
+  wav_out_files = read_nonempty_lines(params.output_wav_file_list)
   assert(len(wav_files) == len(wav_out_files))
-  impulses = list_cyclic_iterator(return_nonempty_lines(open(params.impulses_noises_dir+'/info/impulse_files').readlines()), random_seed = params.random_seed)
+  impulses = list_cyclic_iterator(read_nonempty_lines(params.impulses_noises_dir+'/info/impulse_files'), random_seed = params.random_seed)
   noises_impulses_files = glob.glob(params.impulses_noises_dir+'/info/noise_impulse_*')
-  impulse_noise_index = []
+  # map each impulse to the noise list of the first info file which lists it
+  impulse_noise_index = {}
   for file in noises_impulses_files:
     noises_list = []
     impulses_set = set([])
-    for line in return_nonempty_lines(open(file).readlines()):
+    for line in read_nonempty_lines(file):
       line = line.strip()
       if len(line) == 0 or line[0] == '#':
         continue
@@ -65,34 +59,38 @@ if __name__ == "__main__":
         impulses_set = set(parts[1].split())
       else:
         raise Exception('Unknown format of ' + file)
-      impulse_noise_index.append([impulses_set, noises_list])
+    for impulse in impulses_set:
+      impulse_noise_index.setdefault(impulse, noises_list)
 
-  command_list = []
-  for i in range(len(wav_files)):
-    wav_file = " ".join(wav_files[i].split()[1:])
-    output_wav_file = wav_out_files[i]
-    impulse_file = impulses.next()
-    noise_file = ''
-    snr = ''
-    found_impulse = False
-    if add_noise:
-      for i in xrange(len(impulse_noise_index)):
-        if impulse_file in impulse_noise_index[i][0]:
-          noise_file = impulse_noise_index[i][1].next()
-          snr = snrs.next()
+  # the commands are written out as they are generated rather than collected,
+  # into a temporary file which replaces the output only once all of them are written
+  temp_command_file = params.output_command_file + '.tmp'
+  try:
+    with open(temp_command_file, 'w', buffering = 1 << 20) as file_handle:
+      for i in range(len(wav_files)):
+        wav_file = " ".join(wav_files[i].split()[1:])
+        output_wav_file = wav_out_files[i]
+        impulse_file = next(impulses)
+        noise_file = ''
+        snr = ''
+        if add_noise and impulse_file in impulse_noise_index:
+          noise_file = next(impulse_noise_index[impulse_file])
+          snr = next(snrs)
           assert(len(wav_file.strip()) > 0)
           assert(len(impulse_file.strip()) > 0)
           assert(len(noise_file.strip()) > 0)
           assert(len(snr.strip()) > 0)
           assert(len(output_wav_file.strip()) > 0)
-          command_list.append("{4} {0} wav-reverberate --noise-file={2} --snr-db={3} - {1} - |\n".format(wav_file, impulse_file, noise_file, snr, output_wav_file))
-          found_impulse = True
-          break
-    if not found_impulse:
-      assert(len(wav_file.strip()) > 0)
-      assert(len(impulse_file.strip()) > 0)
-      assert(len(output_wav_file.strip()) > 0)
-      command_list.append("{2} {0} wav-reverberate - {1} - |\n".format(wav_file, impulse_file, output_wav_file))
-  file_handle = open(params.output_command_file, 'w')
-  file_handle.write("".join(command_list))
-  file_handle.close()
+          command = "{4} {0} wav-reverberate --noise-file={2} --snr-db={3} - {1} - |\n".format(wav_file, impulse_file, noise_file, snr, output_wav_file)
+        else:
+          assert(len(wav_file.strip()) > 0)
+          assert(len(impulse_file.strip()) > 0)
+          assert(len(output_wav_file.strip()) > 0)
+          command = "{2} {0} wav-reverberate - {1} - |\n".format(wav_file, impulse_file, output_wav_file)
+        file_handle.write(command)
+  except:
+    # do not leave a partial command file behind in the data directory
+    if os.path.exists(temp_command_file):
+      os.remove(temp_command_file)
+    raise
+  os.rename(temp_command_file, params.output_command_file)